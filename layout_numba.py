@@ -0,0 +1,206 @@
+"""Numba-compiled force-directed layout kernels used by the visualizer."""
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _fr_step(pos, A, k, t):
+    """One Fruchterman-Reingold iteration, moving each node by at most t.
+
+    Every node's displacement only reads pos, so the O(N^2) force sum is
+    split across threads by node before any position is updated.
+    """
+    n = pos.shape[0]
+    disp = np.zeros_like(pos)
+    for i in prange(n):
+        fx = 0.0
+        fy = 0.0
+        for j in range(n):
+            if i == j:
+                continue
+            dx = pos[i, 0] - pos[j, 0]
+            dy = pos[i, 1] - pos[j, 1]
+            d = np.sqrt(dx * dx + dy * dy)
+            if d < 0.01:
+                d = 0.01
+            # Repulsive k^2/d between every pair, attractive d^2/k along edges
+            f = (k * k / d - A[i, j] * d * d / k) / d
+            fx += dx * f
+            fy += dy * f
+        disp[i, 0] = fx
+        disp[i, 1] = fy
+    for i in prange(n):
+        length = np.sqrt(disp[i, 0] ** 2 + disp[i, 1] ** 2)
+        if length > 0.0:
+            step = min(length, t) / length
+            pos[i, 0] += disp[i, 0] * step
+            pos[i, 1] += disp[i, 1] * step
+
+
+@njit(cache=True, nogil=True)
+def fr_layout(pos, A, k, iterations, t0):
+    """Fruchterman-Reingold layout on an (N,2) position array.
+
+    A is the dense adjacency matrix, k the optimal edge length and t0 the
+    initial temperature, which decays linearly to zero. pos is updated in
+    place and returned. The GIL is released, so the layout can run on a
+    worker thread while Tk keeps handling events.
+    """
+    t = t0
+    dt = t0 / (iterations + 1)
+    for _ in range(iterations):
+        _fr_step(pos, A, k, t)
+        t -= dt
+    return pos
+
+
+@njit(cache=True)
+def _build_quadtree(pos, max_depth):
+    """Insert every point into a quadtree stored as parallel arrays.
+
+    Returns (child, com, mass, body, half, nq): child[q] holds the four
+    children of cell q (-1 if absent), com/mass the centre of mass and
+    point count, body the point stored in a leaf (-2 for internal cells)
+    and half the half-width of the cell.
+    """
+    n = pos.shape[0]
+    cap = 8 * n + 8
+    child = -np.ones((cap, 4), dtype=np.int64)
+    com = np.zeros((cap, 2), dtype=np.float64)
+    center = np.zeros((cap, 2), dtype=np.float64)
+    half = np.zeros(cap, dtype=np.float64)
+    mass = np.zeros(cap, dtype=np.float64)
+    body = -np.ones(cap, dtype=np.int64)
+
+    lo0 = pos[:, 0].min()
+    hi0 = pos[:, 0].max()
+    lo1 = pos[:, 1].min()
+    hi1 = pos[:, 1].max()
+    center[0, 0] = 0.5 * (lo0 + hi0)
+    center[0, 1] = 0.5 * (lo1 + hi1)
+    half[0] = 0.5 * max(hi0 - lo0, hi1 - lo1) + 1e-6
+    nq = 1
+
+    for i in range(n):
+        x = pos[i, 0]
+        y = pos[i, 1]
+        node = 0
+        depth = 0
+        while True:
+            mass[node] += 1.0
+            com[node, 0] += x
+            com[node, 1] += y
+            if body[node] == -1:
+                # Empty root
+                body[node] = i
+                break
+            if body[node] >= 0:
+                # Leaf holding one point: split it, unless the tree is too
+                # deep (coincident points) or full, in which case the leaf
+                # just aggregates
+                if depth >= max_depth or nq + 2 > cap:
+                    break
+                b = body[node]
+                body[node] = -2
+                q = (pos[b, 0] > center[node, 0]) + 2 * (pos[b, 1] > center[node, 1])
+                c = nq
+                nq += 1
+                child[node, q] = c
+                half[c] = 0.5 * half[node]
+                center[c, 0] = center[node, 0] + (half[c] if q & 1 else -half[c])
+                center[c, 1] = center[node, 1] + (half[c] if q & 2 else -half[c])
+                body[c] = b
+                mass[c] = 1.0
+                com[c, 0] = pos[b, 0]
+                com[c, 1] = pos[b, 1]
+            q = (x > center[node, 0]) + 2 * (y > center[node, 1])
+            c = child[node, q]
+            if c == -1:
+                if nq + 1 > cap:
+                    break
+                c = nq
+                nq += 1
+                child[node, q] = c
+                half[c] = 0.5 * half[node]
+                center[c, 0] = center[node, 0] + (half[c] if q & 1 else -half[c])
+                center[c, 1] = center[node, 1] + (half[c] if q & 2 else -half[c])
+                body[c] = i
+                mass[c] = 1.0
+                com[c, 0] = x
+                com[c, 1] = y
+                break
+            node = c
+            depth += 1
+
+    for q in range(nq):
+        com[q, 0] /= mass[q]
+        com[q, 1] /= mass[q]
+    return child, com, mass, body, half, nq
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def bh_layout(pos, edges, k, iterations, t0, theta):
+    """Fruchterman-Reingold layout with Barnes-Hut approximated repulsion.
+
+    edges is an (E,2) array of node indices into pos. Repulsion from a
+    quadtree cell of width s at distance d is taken from its centre of
+    mass when s/d < theta, which makes each iteration O(N log N).
+    """
+    n = pos.shape[0]
+    max_depth = 32
+    disp = np.zeros((n, 2), dtype=np.float64)
+    stack = np.empty(4 * max_depth + 8, dtype=np.int64)
+    t = t0
+    dt = t0 / (iterations + 1)
+    for _ in range(iterations):
+        child, com, mass, body, half, nq = _build_quadtree(pos, max_depth)
+        disp[:] = 0.0
+
+        # Approximated repulsion k^2/d per unit of cell mass
+        for i in range(n):
+            top = 0
+            stack[top] = 0
+            top += 1
+            while top > 0:
+                top -= 1
+                node = stack[top]
+                if body[node] == i and mass[node] == 1.0:
+                    continue
+                dx = pos[i, 0] - com[node, 0]
+                dy = pos[i, 1] - com[node, 1]
+                d = np.sqrt(dx * dx + dy * dy)
+                if d < 0.01:
+                    d = 0.01
+                if body[node] >= 0 or 2.0 * half[node] / d < theta:
+                    f = mass[node] * k * k / (d * d)
+                    disp[i, 0] += dx * f
+                    disp[i, 1] += dy * f
+                else:
+                    for q in range(4):
+                        if child[node, q] >= 0:
+                            stack[top] = child[node, q]
+                            top += 1
+
+        # Exact attraction d^2/k along edges
+        for e in range(edges.shape[0]):
+            u = edges[e, 0]
+            v = edges[e, 1]
+            dx = pos[u, 0] - pos[v, 0]
+            dy = pos[u, 1] - pos[v, 1]
+            d = np.sqrt(dx * dx + dy * dy)
+            if d < 0.01:
+                d = 0.01
+            f = d / k
+            disp[u, 0] -= dx * f
+            disp[u, 1] -= dy * f
+            disp[v, 0] += dx * f
+            disp[v, 1] += dy * f
+
+        for i in range(n):
+            length = np.sqrt(disp[i, 0] ** 2 + disp[i, 1] ** 2)
+            if length > 0.0:
+                step = min(length, t) / length
+                pos[i, 0] += disp[i, 0] * step
+                pos[i, 1] += disp[i, 1] * step
+        t -= dt
+    return pos
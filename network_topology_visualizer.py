@@ -7,9 +7,60 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
 from matplotlib.patches import Circle, FancyBboxPatch, Rectangle, Wedge
 from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba, to_rgba_array
+from matplotlib.path import Path
+from matplotlib.text import Text
+from matplotlib.transforms import Affine2D, Bbox
+from bisect import bisect_left, insort
+from ipaddress import AddressValueError, IPv4Address
 import json
+import queue
+import threading
+from collections import Counter, deque
+from collections.abc import Mapping
 import numpy as np
 import random
+import re
+import time
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib json module
+    orjson = None
+
+try:
+    from layout_numba import fr_layout, bh_layout
+except ImportError:  # numba not installed
+    fr_layout = bh_layout = None
+
+try:
+    import nx_cugraph
+except ImportError:  # no GPU NetworkX backend
+    nx_cugraph = None
+
+try:
+    from scipy.optimize import minimize
+    from scipy.sparse import csgraph
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy not installed
+    minimize = csgraph = cKDTree = None
+
+# Node counts at which the initial layout switches to L-BFGS energy
+# minimization and, above that, to Barnes-Hut repulsion
+LBFGS_THRESHOLD = 50
+BARNES_HUT_THRESHOLD = 500
+# Node count above which the layout runs on the GPU when nx-cugraph is present
+GPU_LAYOUT_THRESHOLD = 1000
+# Node count above which a full layout is computed on a worker thread
+BACKGROUND_LAYOUT_THRESHOLD = 200
+# Node count above which the statistics' path metrics are computed on a
+# worker thread
+BACKGROUND_METRICS_THRESHOLD = 200
+# Node count above which nodes are drawn as one scatter, with the label of
+# the node under the pointer shown on hover instead of a label per node
+SCATTER_NODE_THRESHOLD = 100
+# Node count above which click hit-testing goes through a KD-tree
+KDTREE_THRESHOLD = 500
 
 # Device type configurations
 DEVICE_TYPES = {
@@ -19,6 +70,9 @@ DEVICE_TYPES = {
     'Computer': {'color': '#9370DB', 'shape': 'rect', 'icon': '💻'},
     'Server': {'color': '#E74C3C', 'shape': 'rect', 'icon': '🖥️'}
 }
+# Device colours converted to RGBA once, for the per-redraw and per-frame
+# colour updates
+DEVICE_RGBA = {name: to_rgba(d['color']) for name, d in DEVICE_TYPES.items()}
 
 # Cable type configurations
 CABLE_TYPES = {
@@ -26,11 +80,65 @@ CABLE_TYPES = {
     'Fiber Optic': {'color': '#FFD700', 'style': 'solid', 'width': 3.0, 'speed': 1.5},
     'Wireless': {'color': '#87CEEB', 'style': 'dashed', 'width': 2.0, 'speed': 0.8}
 }
+# Integer id per cable type, and the cable styling as arrays indexed by it
+CABLE_IDS = {name: i for i, name in enumerate(CABLE_TYPES)}
+CABLE_RGBA = to_rgba_array([c['color'] for c in CABLE_TYPES.values()])
+CABLE_WIDTHS = np.array([c['width'] for c in CABLE_TYPES.values()])
+CABLE_STYLES = np.array([c['style'] for c in CABLE_TYPES.values()])
 
 def default_node_label(n):
     return f"N{n}"
 
+# Matches labels produced by default_node_label(), capturing the number
+_NID = re.compile(r'^N(\d+)$')
+
+class PositionView(Mapping):
+    """Read-only node -> (x, y) view over the app's position array"""
+    def __init__(self, app):
+        self._app = app
+
+    def __getitem__(self, node):
+        x, y = self._app.pos_xy[self._app.node_index[node]]
+        return (float(x), float(y))
+
+    def __contains__(self, node):
+        return node in self._app.node_index
+
+    def __iter__(self):
+        return iter(self._app.pos_nodes)
+
+    def __len__(self):
+        return len(self._app.pos_nodes)
+
 class NetworkVisualizerApp:
+    # Shared style for the node label boxes; Text copies it on creation
+    LABEL_BBOX = dict(boxstyle='round,pad=0.3', facecolor='white',
+                      linewidth=1.5, alpha=0.95)
+    # Scatter marker per device shape, in units of 0.1 data units so they
+    # match the node patches when scaled by the same marker size
+    NODE_MARKERS = {
+        'circle': Path.unit_circle().transformed(Affine2D().scale(0.5)),
+        'square': Path.unit_rectangle().transformed(Affine2D().translate(-0.5, -0.5)),
+        'rect': Path.unit_rectangle().transformed(
+            Affine2D().translate(-0.5, -0.5).scale(0.75, 0.6)),
+    }
+    # Packet glow, ring and core as one scatter: sizes in points^2, RGBA faces
+    PACKET_SIZES = np.array([30.0, 20.0, 12.5]) ** 2
+    PACKET_COLORS = np.array([[0, 1, 0, 0.4], [0, 1, 0, 0.6], [0, 1, 0, 1.0]])
+    # Edge colour for the links on a highlighted path
+    HIGHLIGHT_RGBA = to_rgba('#ff4444')
+    # Node outline, and the face and outline of the selected node
+    NODE_EDGE_RGBA = to_rgba('#2E5C8A')
+    SELECTED_RGBA = to_rgba('#FF9500')
+    SELECTED_EDGE_RGBA = to_rgba('#CC7700')
+    # Per-segment trail colours, fading from the oldest segment to the newest
+    TRAIL_COLORS = np.column_stack([np.tile([0, 1, 0], (14, 1)),
+                                    np.linspace(0, 0.5, 14)])
+    # Pulse scale per animation frame, indexed with frame & 255. The step is
+    # ~0.3 rad, rounded so 256 frames hold exactly 12 periods and the wrap
+    # is seamless
+    PULSE_LUT = 1.0 + 0.3 * np.sin(np.arange(256) * (24 * np.pi / 256))
+
     def __init__(self, root):
         self.root = root
         self.root.title("Advanced Network Topology Visualizer")
@@ -43,20 +151,56 @@ class NetworkVisualizerApp:
         self.root.geometry(f"{window_width}x{window_height}")
         
         self.G = nx.Graph()
-        self.pos = {}
+        # Node positions as one contiguous (N,2) array; node_index maps a
+        # node to its row and pos_nodes is the reverse mapping
+        self.pos_xy = np.empty((0, 2), dtype=np.float32)
+        self.node_index = {}
+        self.pos_nodes = []
         self.node_count = 0
         self.selected_node = None
         self.dragging = False
+        self.drag_node = None
+        self._drag_moved = False
+        self._blit_pending = False
         self.animating = False
         self.animation_frame = 0
-        self.packet_trail = []
+        self.packet_trail = deque(maxlen=15)
+        self._tick_id = None  # pending root.after of the animation tick
+        self._unicast_path = None  # path of the running unicast transmission
+        self._broadcast_hop = None  # (parent, child) of the running broadcast hop
         
         # Enhanced attributes
-        self.node_devices = {}  # node -> device type
-        self.node_ips = {}  # node -> IP address
-        self.edge_cables = {}  # (node1, node2) -> cable type
+        # Device types, IPs and cable types are stored on the graph itself,
+        # as the 'device' and 'ip' node and 'cable' edge attributes
+        # Running totals per device and cable type for the statistics,
+        # kept by _set_device() / _set_cable() and the removal paths
+        self._device_counts = Counter()
+        self._cable_counts = Counter()
         self.packet_loss_rate = 0.0  # 0.0 to 1.0
         
+        # Bumped on every node/edge change; keys the BFS predecessor cache
+        self._topology_version = 0
+        self._bfs_cache = {}  # (source, version) -> predecessor dict
+        self._metrics_cache = (None, [])  # (version, network metric lines)
+        self._metrics_job = None  # worker thread computing the metrics
+        self._metrics_queue = queue.Queue()  # (version, lines) from the worker
+        self._edge_idx_pairs = None  # (E,2) node rows, see _ensure_edge_arrays()
+        self._label_artists = {}  # node -> label Text, for patch-drawn nodes only
+        self._kdtree = None  # built lazily over pos_xy, reset when it changes
+        self._layout_dirty = set()  # nodes still waiting for a layout position
+        self._layout_job = None  # worker thread running a large layout
+        self._layout_queue = queue.Queue()  # (version, layout) from the worker
+        self._sorted_nodes = []  # G.nodes kept sorted for the selectors
+        
+        # Set whenever the topology, positions, labels or selection change;
+        # redraw() only rebuilds the static layer when it is set
+        self._static_dirty = True
+        self._highlight_path = None
+        self._rejected_nodes = None
+        self._broadcast_nodes = None
+        self._status_popup = None  # reusable Toplevel, see _show_status()
+        self._status_hide_id = None
+        
         # Animation parameters
         self.animation_speed = 80
         self.frames_per_edge = 20
@@ -75,6 +219,52 @@ class NetworkVisualizerApp:
         self.ax.set_facecolor('#ffffff')
         plt.tight_layout()
         
+        # The axes are set up once and never cleared: redraws update or
+        # remove individual artists, with autoscaling off
+        self.ax.set_autoscale_on(False)
+        self.ax.set_xticks([])
+        self.ax.set_yticks([])
+        self.ax.set_xlim(-1.2, 1.2)
+        self.ax.set_ylim(-1.2, 1.2)
+        self.ax.set_aspect('equal')
+        self.ax.set_title('Network Topology Visualization', 
+                         fontsize=16, fontweight='bold', pad=20)
+        self.node_circles = {}  # node -> persistent device patch
+        # Nodes of large graphs, except the selected and dragged ones
+        self.node_scatter = self.ax.scatter([], [], edgecolors=[self.NODE_EDGE_RGBA],
+                                            linewidths=2.5, zorder=3)
+        # Edges, split into the static set and the dragged node's incident
+        # edges; both collections are updated in place by _draw_static()
+        self.edge_lc = LineCollection([], zorder=1, alpha=0.7)
+        self.drag_lc = LineCollection([], zorder=1, alpha=0.7, animated=True)
+        self.ax.add_collection(self.edge_lc)
+        self.ax.add_collection(self.drag_lc)
+        self._static_artists = []  # markers of the last static draw
+        
+        # Persistent animated artists, excluded from the cached background
+        # and drawn on top of it by _blit_frame()
+        self.trail_lc = LineCollection([], linewidths=3, zorder=5, animated=True)
+        self.ax.add_collection(self.trail_lc)
+        # Pulse glows are rings around the node so they never cover it
+        self.pulse_glows = [Wedge((0, 0), 0.075, 0, 360, width=0.025, alpha=0.3,
+                                  zorder=2, animated=True)
+                            for _ in range(2)]
+        for glow in self.pulse_glows:
+            self.ax.add_patch(glow)
+        self.packet_scatter = self.ax.scatter(
+            np.zeros(3), np.zeros(3), s=self.PACKET_SIZES, c=self.PACKET_COLORS,
+            edgecolors=['none', 'none', '#006600'], linewidths=[0, 0, 2],
+            zorder=6, animated=True)
+        # Created once and only moved, so its text layout is cached between
+        # frames instead of shaping the emoji glyph again every frame
+        self.packet_label = self.ax.text(0, 0, '📦', ha='center', va='center',
+                                         fontsize=16, zorder=9, animated=True)
+        self.hover_label = self.ax.annotate(
+            '', (0, 0), xytext=(0, 14), textcoords='offset points', ha='center',
+            va='bottom', fontsize=9, fontweight='bold', bbox=self.LABEL_BBOX,
+            zorder=7, animated=True)
+        self._hover_node = None
+        
         # Canvas
         canvas_frame = ttk.Frame(main_container)
         canvas_frame.grid(row=0, column=0, sticky='nsew', padx=(0, 10))
@@ -84,6 +274,8 @@ class NetworkVisualizerApp:
         self.canvas.mpl_connect('button_press_event', self.on_click)
         self.canvas.mpl_connect('button_release_event', self.on_release)
         self.canvas.mpl_connect('motion_notify_event', self.on_motion)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event', self._on_resize)
 
         # Enhanced control panel with notebook (tabs)
         ctrlframe = ttk.Frame(main_container, padding=10)
@@ -102,6 +294,7 @@ class NetworkVisualizerApp:
         # Create notebook for tabs
         self.notebook = ttk.Notebook(ctrlframe)
         self.notebook.grid(row=1, column=0, columnspan=2, sticky='nsew', pady=(0,10))
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Configure grid weight
         ctrlframe.grid_rowconfigure(1, weight=1)
@@ -306,6 +499,7 @@ class NetworkVisualizerApp:
     def create_file_tab(self):
         tab = ttk.Frame(self.notebook, padding=10)
         self.notebook.add(tab, text='File')
+        self._stats_tab = tab
         
         ttk.Label(tab, text='File Operations', style='Section.TLabel').grid(
             row=0, column=0, columnspan=2, pady=(0,8))
@@ -353,40 +547,46 @@ class NetworkVisualizerApp:
         self.node_count += 1
         nid = default_node_label(self.node_count)
         self.G.add_node(nid)
-        
-        # Set default device type and IP
-        self.node_devices[nid] = self.device_type.get()
+        self._set_device(nid, self.device_type.get())
+        self._topology_changed()
+        insort(self._sorted_nodes, nid)
         
         # Better initial positioning
-        angle = 2 * np.pi * len(self.pos) / max(8, len(self.pos) + 1)
+        n = len(self.pos_nodes)
+        angle = 2 * np.pi * n / max(8, n + 1)
         radius = 0.5
-        self.pos[nid] = (radius * np.cos(angle), radius * np.sin(angle))
+        self.node_index[nid] = n
+        self.pos_nodes.append(nid)
+        self.pos_xy = np.vstack([self.pos_xy, np.array(
+            [[radius * np.cos(angle), radius * np.sin(angle)]], dtype=np.float32)])
+        self._kdtree = None
+        if self._layout_job is not None:
+            # Placed with the rest once the running layout is redone
+            self._layout_dirty.add(nid)
         
         self.update_comboboxes()
         self.update_ip_display()
-        self.redraw()
-        self.log(f"Added {self.node_devices[nid]} node: {nid}")
+        self._refresh_static()
+        self.log(f"Added {self.G.nodes[nid]['device']} node: {nid}")
 
     def remove_selected_node(self):
         if self.selected_node and self.selected_node in self.G.nodes:
             node = self.selected_node
+            if 'device' in self.G.nodes[node]:
+                self._device_counts[self.G.nodes[node]['device']] -= 1
+            for _, _, cable in self.G.edges(node, data='cable'):
+                if cable is not None:
+                    self._cable_counts[cable] -= 1
             self.G.remove_node(node)
-            self.pos.pop(node, None)
-            self.node_devices.pop(node, None)
-            self.node_ips.pop(node, None)
-            
-            # Remove edge cables
-            edges_to_remove = []
-            for edge in list(self.edge_cables.keys()):
-                if node in edge:
-                    edges_to_remove.append(edge)
-            for edge in edges_to_remove:
-                self.edge_cables.pop(edge, None)
+            self._topology_changed()
+            self._remove_position(node)
+            self._remove_node_artists(node)
+            del self._sorted_nodes[bisect_left(self._sorted_nodes, node)]
             
             self.selected_node = None
             self.update_comboboxes()
             self.update_ip_display()
-            self.redraw()
+            self._refresh_static()
             self.log(f"Removed node: {node}")
         else:
             messagebox.showinfo('Remove Node', 
@@ -402,12 +602,12 @@ class NetworkVisualizerApp:
             messagebox.showwarning('Add Connection', 'Choose two different nodes.')
             return
         
-        self.G.add_edge(a, b)
         cable = self.cable_type.get()
-        self.edge_cables[(a, b)] = cable
-        self.edge_cables[(b, a)] = cable  # Bidirectional
+        self.G.add_edge(a, b)
+        self._set_cable(a, b, cable)
+        self._topology_changed()
         
-        self.redraw()
+        self._refresh_static()
         self.log(f"Connected {a} ⟷ {b} via {cable}")
 
     def remove_edge(self):
@@ -417,10 +617,11 @@ class NetworkVisualizerApp:
             messagebox.showwarning('Remove Connection', 'Choose two nodes.')
             return
         if self.G.has_edge(a, b):
+            if 'cable' in self.G.edges[a, b]:
+                self._cable_counts[self.G.edges[a, b]['cable']] -= 1
             self.G.remove_edge(a, b)
-            self.edge_cables.pop((a, b), None)
-            self.edge_cables.pop((b, a), None)
-            self.redraw()
+            self._topology_changed()
+            self._refresh_static()
             self.log(f"Removed connection: {a} ⟷ {b}")
         else:
             messagebox.showinfo('Remove Connection', 'Connection does not exist.')
@@ -438,47 +639,171 @@ class NetworkVisualizerApp:
                                  'Please enter a valid IP address (e.g., 192.168.1.1)')
             return
         
-        self.node_ips[node] = ip
+        self._set_ip(node, ip)
+        self._static_dirty = True
         self.update_ip_display()
-        self.redraw()
+        self._refresh_static()
         self.log(f"Set IP for {node}: {ip}")
 
     def auto_assign_ips(self):
         base_ip = "192.168.1."
         counter = 1
         
-        for node in sorted(self.G.nodes):
-            self.node_ips[node] = f"{base_ip}{counter}"
+        for node in self._sorted_nodes:
+            self._set_ip(node, f"{base_ip}{counter}")
             counter += 1
         
+        self._static_dirty = True
         self.update_ip_display()
-        self.redraw()
-        self.log(f"Auto-assigned IPs to {len(self.node_ips)} nodes")
+        self._refresh_static()
+        self.log(f"Auto-assigned IPs to {len(self.G)} nodes")
+
+    def _set_device(self, node, device):
+        attrs = self.G.nodes[node]
+        if 'device' in attrs:
+            self._device_counts[attrs['device']] -= 1
+        attrs['device'] = device
+        self._device_counts[device] += 1
+
+    def _set_cable(self, a, b, cable):
+        attrs = self.G.edges[a, b]
+        if 'cable' in attrs:
+            self._cable_counts[attrs['cable']] -= 1
+        attrs['cable'] = cable
+        self._cable_counts[cable] += 1
+
+    def _recount_types(self):
+        # Rebuild the running totals from scratch after a bulk load
+        self._device_counts = Counter(nx.get_node_attributes(self.G, 'device').values())
+        self._cable_counts = Counter(nx.get_edge_attributes(self.G, 'cable').values())
+
+    def _set_ip(self, node, ip):
+        # The address is also kept parsed as a 32-bit int, which is what
+        # broadcasts match on when both sides have one
+        attrs = self.G.nodes[node]
+        attrs['ip'] = ip
+        try:
+            attrs['ip_int'] = int(IPv4Address(ip))
+        except AddressValueError:
+            attrs.pop('ip_int', None)
 
     def validate_ip(self, ip):
-        parts = ip.split('.')
-        if len(parts) != 4:
-            return False
         try:
-            return all(0 <= int(p) <= 255 for p in parts)
-        except:
+            IPv4Address(ip)
+        except AddressValueError:
             return False
+        return True
+
+    @property
+    def pos(self):
+        return PositionView(self)
+
+    @pos.setter
+    def pos(self, mapping):
+        self._set_positions(list(mapping), list(mapping.values()))
+
+    def _set_positions(self, nodes, xy):
+        self.pos_nodes = list(nodes)
+        self.node_index = {n: i for i, n in enumerate(self.pos_nodes)}
+        self.pos_xy = np.asarray(xy, dtype=np.float32).reshape(-1, 2)
+        self._kdtree = None
+        # Rows may come back in a different order, so the edge rows are stale
+        self._edge_idx_pairs = None
+        self._static_dirty = True
+
+    def _node_label(self, node):
+        # Persistent label, created the first time the node is drawn as a patch
+        label = self._label_artists.get(node)
+        if label is None:
+            label = self._label_artists[node] = self.ax.add_artist(
+                Text(0, 0, '', ha='center', va='center', fontsize=9,
+                     fontweight='bold', zorder=4, bbox=self.LABEL_BBOX))
+        return label
+
+    def _node_patch(self, node, shape):
+        # Persistent device patch, recreated only if the shape changed
+        patch = self.node_circles.get(node)
+        if patch is None or isinstance(patch, Circle) != (shape == 'circle'):
+            if patch is not None:
+                patch.remove()
+            if shape == 'circle':
+                patch = Circle((0, 0), 0.05, linewidth=2.5, zorder=3)
+            else:
+                patch = Rectangle((0, 0), 0.1, 0.1, linewidth=2.5, zorder=3)
+            self.node_circles[node] = self.ax.add_patch(patch)
+        return patch
+
+    def _remove_node_artists(self, node):
+        for artists in (self.node_circles, self._label_artists):
+            artist = artists.pop(node, None)
+            if artist is not None:
+                artist.remove()
+
+    def _remove_position(self, node):
+        i = self.node_index.pop(node, None)
+        if i is None:
+            return
+        self.pos_xy = np.delete(self.pos_xy, i, axis=0)
+        self._kdtree = None
+        del self.pos_nodes[i]
+        for n in self.pos_nodes[i:]:
+            self.node_index[n] -= 1
+
+    def _topology_changed(self):
+        self._static_dirty = True
+        self._topology_version += 1
+        self._bfs_cache.clear()
+        self._edge_idx_pairs = None
+
+    def _ensure_edge_arrays(self):
+        # Per-edge row indices and cable styling, rebuilt lazily after topology
+        # changes so redraw() never walks G.edges
+        if self._edge_idx_pairs is not None:
+            return
+        edges = list(self.G.edges(data='cable', default='Ethernet'))
+        ni = self.node_index
+        idx_pairs = np.array([[ni[u], ni[v]] for u, v, _ in edges], dtype=np.int32).reshape(-1, 2)
+        cable_ids = np.array([CABLE_IDS[cable] for _, _, cable in edges], dtype=np.uint8)
+        self._edge_idx_pairs = idx_pairs
+        self._edge_keys = (idx_pairs.min(axis=1).astype(np.int64) * len(self.pos_nodes)
+                           + idx_pairs.max(axis=1))
+        self._edge_colors = CABLE_RGBA[cable_ids]
+        self._edge_widths = CABLE_WIDTHS[cable_ids]
+        self._edge_styles = CABLE_STYLES[cable_ids]
+
+    def _shortest_path(self, src, dst):
+        # One BFS per source and topology version; later queries from the
+        # same source just walk the predecessor tree back from dst
+        key = (src, self._topology_version)
+        pred = self._bfs_cache.get(key)
+        if pred is None:
+            pred = self._bfs_cache[key] = nx.predecessor(self.G, src)
+        if dst not in pred:
+            raise nx.NetworkXNoPath(f"No path between {src} and {dst}.")
+        path = [dst]
+        while path[-1] != src:
+            path.append(pred[path[-1]][0])
+        path.reverse()
+        return path
 
     def update_comboboxes(self):
-        nodes = sorted(list(self.G.nodes))
+        nodes = tuple(self._sorted_nodes)
         for cb in (self.edge_a_cb, self.edge_b_cb, self.src_cb, 
                    self.dst_cb, self.ip_node_cb):
             cb['values'] = nodes
             val = cb.get()
-            if val not in nodes:
+            if val not in self.G:
                 cb.set('')
 
     def update_ip_display(self):
+        # Build every row first and hand them to Tk in a single insert call
+        nodes = self.G.nodes
+        items = [f"{node}: {nodes[node].get('ip', 'Not set')} "
+                 f"({nodes[node].get('device', 'Router')})"
+                 for node in self._sorted_nodes]
         self.ip_listbox.delete(0, tk.END)
-        for node in sorted(self.G.nodes):
-            ip = self.node_ips.get(node, 'Not set')
-            device = self.node_devices.get(node, 'Router')
-            self.ip_listbox.insert(tk.END, f"{node}: {ip} ({device})")
+        if items:
+            self.ip_listbox.insert(tk.END, *items)
 
     def log(self, message):
         if hasattr(self, 'log_text'):
@@ -486,190 +811,613 @@ class NetworkVisualizerApp:
             self.log_text.see(tk.END)
 
     # ---------- Enhanced Drawing ----------
-    def redraw(self, highlight_path=None, packet_pos=None, pulse_nodes=None, 
-               rejected_nodes=None, broadcast_nodes=None):
-        self.ax.clear()
-        self.ax.set_xticks([])
-        self.ax.set_yticks([])
-        self.ax.set_xlim(-1.2, 1.2)
-        self.ax.set_ylim(-1.2, 1.2)
-        
-        if not self.pos and len(self.G) > 0:
-            self.pos = nx.spring_layout(self.G, k=0.5, iterations=50)
+    def redraw(self, highlight_path=None, rejected_nodes=None, broadcast_nodes=None):
+        """Show the topology with the given styling and no packet in flight"""
+        style = tuple(None if s is None else tuple(s)
+                      for s in (highlight_path, rejected_nodes, broadcast_nodes))
+        if style != (self._highlight_path, self._rejected_nodes, self._broadcast_nodes):
+            self._highlight_path, self._rejected_nodes, self._broadcast_nodes = style
+            self._static_dirty = True
+        if self._static_dirty:
+            self._draw_static()
+        else:
+            # Nothing static changed, only clear the packet overlay
+            self._draw_dynamic()
+
+    def _draw_static(self):
+        """Full rebuild of the static layer; animation frames use _draw_dynamic()"""
+        highlight_path = self._highlight_path
+        rejected_nodes = self._rejected_nodes
+        broadcast_nodes = self._broadcast_nodes
+        self.background = None
+        self._overlay_bbox = None
+        self._frame_packet_pos = None
+        self._frame_pulse_nodes = None
+        self._drag_neighbors = []
+        self._hover_node = None
+        # While dragging, the dragged node and its incident edges are kept
+        # out of the cached background and blitted on every motion event
+        drag = self.drag_node if self.dragging else None
+        self._drag_active = drag is not None and drag in self.G
+        for artist in self._static_artists:
+            artist.remove()
+        self._static_artists = []
+        self.edge_lc.set_segments([])
+        self.drag_lc.set_segments([])
+        self.node_scatter.set_offsets(np.empty((0, 2)))
+        
+        if (self._layout_job is None and len(self.G) > 0
+                and (not self.pos_nodes or self._layout_dirty)):
+            self._update_layout()
+        self._static_dirty = False
+        
+        if self._layout_job is not None:
+            # Nodes have no real position yet, so nothing can be dragged
+            self._drag_active = False
+            self._static_artists.append(self.ax.text(
+                0, 0, 'Computing layout...',
+                ha='center', va='center', fontsize=14, color='gray'))
+            self.canvas.draw_idle()
+            return
         
         if len(self.G) == 0:
-            self.ax.text(0, 0, 'Click "Add Node" to start building your network',
-                        ha='center', va='center', fontsize=14, color='gray')
+            self._static_artists.append(self.ax.text(
+                0, 0, 'Click "Add Node" to start building your network',
+                ha='center', va='center', fontsize=14, color='gray'))
             self.canvas.draw_idle()
             return
 
-        # Draw edges with cable types
-        for edge in self.G.edges:
-            cable_type = self.edge_cables.get(edge, 'Ethernet')
-            cable_config = CABLE_TYPES[cable_type]
-            
-            x = [self.pos[edge[0]][0], self.pos[edge[1]][0]]
-            y = [self.pos[edge[0]][1], self.pos[edge[1]][1]]
-            
-            color = cable_config['color']
-            width = cable_config['width']
-            style = cable_config['style']
+        # Draw edges with cable types as a single LineCollection
+        if self.G.number_of_edges():
+            self._ensure_edge_arrays()
+            idx_pairs = self._edge_idx_pairs
+            segs = self.pos_xy[idx_pairs]
+            edge_colors = self._edge_colors
+            edge_widths = self._edge_widths
             
-            # Highlight path edges
+            # Highlight path edges, matched on (min, max) row-index keys
             if highlight_path and len(highlight_path) >= 2:
-                path_edges = list(zip(highlight_path, highlight_path[1:]))
-                if edge in path_edges or (edge[1], edge[0]) in path_edges:
-                    color = '#ff4444'
-                    width = 4.0
-            
-            self.ax.plot(x, y, color=color, linewidth=width,
-                        linestyle=style, zorder=1, alpha=0.7)
+                hp = np.array([self.node_index.get(n, -1) for n in highlight_path])
+                a, b = hp[:-1], hp[1:]
+                keys = np.minimum(a, b) * len(self.pos_nodes) + np.maximum(a, b)
+                mask = np.isin(self._edge_keys, keys)
+                edge_colors = edge_colors.copy()
+                edge_colors[mask] = self.HIGHLIGHT_RGBA
+                edge_widths = np.where(mask, 4.0, edge_widths)
+
+            def update_edges(lc, mask):
+                lc.set_segments(segs[mask])
+                if mask.any():
+                    lc.set_color(edge_colors[mask])
+                    # Widths and styles are broadcast against each other to
+                    # a common length, so reset the style to a scalar first;
+                    # mixing the old and new edge counts costs lcm(E_old, E_new)
+                    lc.set_linestyle('solid')
+                    lc.set_linewidth(edge_widths[mask])
+                    lc.set_linestyle(list(self._edge_styles[mask]))
+
+            drag_row = self.node_index[drag] if self._drag_active else -1
+            incident = (idx_pairs == drag_row).any(axis=1)
+            update_edges(self.edge_lc, ~incident)
+            update_edges(self.drag_lc, incident)
+            if incident.any():
+                ends = idx_pairs[incident]
+                self._drag_segs = segs[incident]
+                self._drag_ends = (ends[:, 1] == drag_row).astype(np.intp)
+                others = np.where(ends[:, 0] == drag_row, ends[:, 1], ends[:, 0])
+                self._drag_neighbors = [self.pos_nodes[i] for i in others]
 
+        # Special highlighting for broadcast/rejected nodes
+        for node in rejected_nodes or ():
+            if node in self.node_index:
+                # Red X overlay for rejected packets
+                x, y = self.pos_xy[self.node_index[node]]
+                self._static_artists += self.ax.plot(
+                    [x-0.04, x+0.04], [y-0.04, y+0.04], 'r-', linewidth=3, zorder=10)
+                self._static_artists += self.ax.plot(
+                    [x-0.04, x+0.04], [y+0.04, y-0.04], 'r-', linewidth=3, zorder=10)
+        
+        for node in broadcast_nodes or ():
+            if node in self.node_index:
+                # Green checkmark for accepting node
+                x, y = self.pos_xy[self.node_index[node]]
+                self._static_artists += self.ax.plot(
+                    [x-0.02, x, x+0.04], [y, y-0.03, y+0.05], 'g-', linewidth=3, zorder=10)
+        
+        # Large graphs draw most nodes as one scatter; only the selected and
+        # dragged nodes and the dragged node's neighbours keep a patch and
+        # a label
+        if len(self.G) > SCATTER_NODE_THRESHOLD:
+            patch_nodes = {n for n in (self.selected_node, drag, *self._drag_neighbors)
+                           if n in self.G}
+            self._draw_node_scatter(patch_nodes)
+        else:
+            patch_nodes = self.G.nodes
+        
         # Draw nodes with device types
-        for node in self.G.nodes:
-            x, y = self.pos[node]
+        for node in patch_nodes:
+            x, y = self.pos_xy[self.node_index[node]]
             
-            device_type = self.node_devices.get(node, 'Router')
-            device_config = DEVICE_TYPES[device_type]
-            
-            color = device_config['color']
-            shape = device_config['shape']
-            icon = device_config['icon']
+            device = self.G.nodes[node].get('device', 'Router')
+            color = DEVICE_RGBA[device]
+            shape = DEVICE_TYPES[device]['shape']
             
             base_size = 0.05
-            edge_color = '#2E5C8A'
+            edge_color = self.NODE_EDGE_RGBA
             
             if node == self.selected_node:
-                color = '#FF9500'
-                edge_color = '#CC7700'
+                color = self.SELECTED_RGBA
+                edge_color = self.SELECTED_EDGE_RGBA
                 base_size = 0.06
             
-            # Special highlighting for broadcast/rejected nodes
-            if rejected_nodes and node in rejected_nodes:
-                # Red X overlay for rejected packets
-                self.ax.plot([x-0.04, x+0.04], [y-0.04, y+0.04], 
-                           'r-', linewidth=3, zorder=10)
-                self.ax.plot([x-0.04, x+0.04], [y+0.04, y-0.04], 
-                           'r-', linewidth=3, zorder=10)
-            
-            if broadcast_nodes and node in broadcast_nodes:
-                # Green checkmark for accepting node
-                self.ax.plot([x-0.02, x, x+0.04], [y, y-0.03, y+0.05], 
-                           'g-', linewidth=3, zorder=10)
-            
-            # Pulse effect
-            pulse_factor = 1.0
-            if pulse_nodes and node in pulse_nodes:
-                pulse_factor = 1.0 + 0.3 * np.sin(self.animation_frame * 0.3)
-                glow = Circle((x, y), base_size * 1.5 * pulse_factor, 
-                            color=color, alpha=0.3, zorder=2)
-                self.ax.add_patch(glow)
-            
-            # Draw device shape
+            # Update the device shape in place
+            patch = self._node_patch(node, shape)
             if shape == 'circle':
-                circle = Circle((x, y), base_size * pulse_factor, 
-                              color=color, ec=edge_color, linewidth=2.5, zorder=3)
-                self.ax.add_patch(circle)
-            elif shape == 'square':
-                size = base_size * 2 * pulse_factor
-                square = Rectangle((x-base_size*pulse_factor, y-base_size*pulse_factor), 
-                                  size, size,
-                                  color=color, ec=edge_color, linewidth=2.5, zorder=3)
-                self.ax.add_patch(square)
-            elif shape == 'rect':
-                width = base_size * 1.5 * pulse_factor
-                height = base_size * 1.2 * pulse_factor
-                rect = Rectangle((x-width/2, y-height/2), width, height,
-                               color=color, ec=edge_color, linewidth=2.5, zorder=3)
-                self.ax.add_patch(rect)
-            
-            # Node label with IP
-            ip_text = self.node_ips.get(node, '')
-            label_text = f"{icon} {node}"
-            if ip_text:
-                label_text += f"\n{ip_text}"
-            
-            bbox_props = dict(boxstyle='round,pad=0.3', facecolor='white', 
-                            edgecolor=edge_color, linewidth=1.5, alpha=0.95)
-            self.ax.text(x, y + 0.12, label_text, ha='center', va='center',
-                        fontsize=9, fontweight='bold', zorder=4,
-                        bbox=bbox_props)
-
-        # Draw packet with trail
-        if packet_pos is not None:
-            px, py = packet_pos
-            
-            # Trail effect
-            if len(self.packet_trail) > 1:
-                trail_x = [p[0] for p in self.packet_trail]
-                trail_y = [p[1] for p in self.packet_trail]
-                
-                for i in range(len(trail_x) - 1):
-                    alpha = (i + 1) / len(trail_x) * 0.5
-                    self.ax.plot(trail_x[i:i+2], trail_y[i:i+2], 
-                               color='#00FF00', linewidth=3, 
-                               alpha=alpha, zorder=5)
-            
-            # Packet visualization
-            glow = Circle((px, py), 0.06, color='#00FF00', alpha=0.4, zorder=6)
-            self.ax.add_patch(glow)
+                patch.set_center((x, y))
+                patch.set_radius(base_size)
+            else:
+                if shape == 'square':
+                    width = height = base_size * 2
+                else:
+                    width = base_size * 1.5
+                    height = base_size * 1.2
+                patch.set_bounds(x - width/2, y - height/2, width, height)
+            patch.set_facecolor(color)
+            patch.set_edgecolor(edge_color)
+            patch.set_animated(node == drag or node in self._drag_neighbors)
             
-            ring = Circle((px, py), 0.04, color='#00FF00', alpha=0.6, zorder=7)
-            self.ax.add_patch(ring)
+            # Labels persist across redraws and are only updated
+            label = self._node_label(node)
+            label.set_position((x, y + 0.12))
+            label.set_text(self._label_text(node))
+            label.get_bbox_patch().set_edgecolor(edge_color)
+            label.set_animated(node == drag)
+        
+        self.canvas.draw_idle()
+
+    def _draw_node_scatter(self, patch_nodes):
+        nodes = [n for n in self.G.nodes if n not in patch_nodes]
+        for node in nodes:
+            self._remove_node_artists(node)
+        devices = [self.G.nodes[n].get('device', 'Router') for n in nodes]
+        self.node_scatter.set_offsets(self.pos_xy[[self.node_index[n] for n in nodes]])
+        self.node_scatter.set_paths([self.NODE_MARKERS[DEVICE_TYPES[d]['shape']]
+                                     for d in devices])
+        self.node_scatter.set_facecolor(np.array([DEVICE_RGBA[d] for d in devices]).reshape(-1, 4))
+        self._scale_node_scatter()
+
+    def _scale_node_scatter(self):
+        # Marker sizes are in points^2; the markers span 0.1 data units.
+        # Shrink the box to the equal aspect first, as the draw will
+        self.ax.apply_aspect()
+        x0, x1 = self.ax.transData.transform([(0, 0), (1, 0)])[:, 0]
+        size = 0.1 * (x1 - x0) * 72 / self.fig.dpi
+        self.node_scatter.set_sizes([size * size])
+
+    def _label_text(self, node):
+        # Node label with IP
+        attrs = self.G.nodes[node]
+        text = f"{DEVICE_TYPES[attrs.get('device', 'Router')]['icon']} {node}"
+        if attrs.get('ip'):
+            text += f"\n{attrs['ip']}"
+        return text
+
+    def _update_layout(self):
+        """Place the nodes in _layout_dirty, keeping all other positions fixed"""
+        fixed = [n for n in self.pos_nodes if n not in self._layout_dirty]
+        if not fixed:
+            if len(self.G) > BACKGROUND_LAYOUT_THRESHOLD:
+                self._start_layout_job()
+                return
+            self._layout_dirty = set()
+            self._set_positions(*self._compute_layout(self.G))
+            return
+        
+        # Start each new node next to its placed neighbours, if it has any
+        pos = dict(self.pos)
+        placed = set(fixed)
+        for n in self.G.nodes - placed:
+            nbrs = [pos[m] for m in self.G[n] if m in placed]
+            center = np.mean(nbrs, axis=0) if nbrs else (0.0, 0.0)
+            pos[n] = center + np.random.uniform(-0.1, 0.1, 2)
+        if len(self.G) > BACKGROUND_LAYOUT_THRESHOLD:
+            self._start_layout_job(pos, fixed)
+            return
+        self._layout_dirty = set()
+        self._set_positions(*self._partial_layout(self.G, pos, fixed))
+
+    def _partial_layout(self, G, pos, fixed):
+        layout = nx.spring_layout(G, k=0.5, iterations=50, pos=pos, fixed=fixed)
+        return list(layout), list(layout.values())
+
+    def _start_layout_job(self, pos=None, fixed=None):
+        # Large layouts take seconds, so compute them from a snapshot of the
+        # graph on a worker thread; _pump_layout() applies the result on the
+        # Tk thread. The dirty nodes stay dirty until then, which for a full
+        # layout is every node.
+        if fixed is None:
+            self._layout_dirty = set(self.G)
+        G = self.G.copy()
+        version = self._topology_version
+        
+        def work():
+            # A failure is queued too, so the pump never waits forever
+            try:
+                if fixed is None:
+                    result = self._compute_layout(G)
+                else:
+                    result = self._partial_layout(G, pos, fixed)
+            except Exception as e:
+                result = e
+            self._layout_queue.put((version, result))
+        
+        self._layout_job = threading.Thread(target=work, daemon=True)
+        self._layout_job.start()
+        self.root.after(50, self._pump_layout)
+
+    def _pump_layout(self):
+        try:
+            version, layout = self._layout_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._pump_layout)
+            return
+        self._layout_job = None
+        # A layout of a graph that has since changed is dropped; the redraw
+        # below starts a new one if positions are still missing
+        if version == self._topology_version:
+            self._layout_dirty = set()
+            if isinstance(layout, Exception):
+                # Keep the placeholders rather than retrying on every redraw
+                self.log(f"❌ Layout failed: {layout}")
+                pos = self.pos
+                self.pos = {n: pos.get(n, (0.0, 0.0)) for n in self.G.nodes}
+            else:
+                self._set_positions(*layout)
+        self._refresh_static()
+
+    def _compute_layout(self, G):
+        nodes = list(G.nodes)
+        pos = None
+        if nx_cugraph is not None and len(nodes) > GPU_LAYOUT_THRESHOLD:
+            # The backend can still fail at call time, e.g. without a usable
+            # GPU; the CPU layouts below are used instead
+            try:
+                layout = nx.forceatlas2_layout(G, max_iter=100, backend='cugraph')
+                pos = np.array([layout[n] for n in nodes], dtype=np.float32)
+            except Exception:
+                pos = None
+        if pos is not None:
+            pass
+        elif minimize is not None and LBFGS_THRESHOLD <= len(nodes) <= BARNES_HUT_THRESHOLD:
+            pos = self._lbfgs_layout(G)
+        elif fr_layout is None:
+            layout = nx.spring_layout(G, k=0.5, iterations=50)
+            return nodes, [layout[n] for n in nodes]
+        elif len(nodes) > BARNES_HUT_THRESHOLD:
+            index = {n: i for i, n in enumerate(nodes)}
+            edges = np.array([[index[u], index[v]] for u, v in G.edges],
+                             dtype=np.int64).reshape(-1, 2)
+            pos = np.random.rand(len(nodes), 2).astype(np.float32)
+            pos = bh_layout(pos, edges, np.float32(0.5), 50, np.float32(0.1), 0.9)
+        else:
+            A = nx.to_numpy_array(G, nodelist=nodes, dtype=np.float32)
+            pos = np.random.rand(len(nodes), 2).astype(np.float32)
+            pos = fr_layout(pos, A, np.float32(0.5), 50, np.float32(0.1))
+        
+        # Center and scale into [-1, 1] like nx.spring_layout
+        pos -= pos.mean(axis=0)
+        lim = np.abs(pos).max()
+        if lim > 0:
+            pos /= lim
+        return nodes, pos
+
+    def _lbfgs_layout(self, G, k=0.5, gravity=1.0):
+        """Minimize the Fruchterman-Reingold energy with L-BFGS"""
+        nodes = list(G.nodes)
+        n = len(nodes)
+        # Attraction only needs the edge list: take each edge once from the
+        # sparse adjacency instead of masking a dense N x N matrix
+        S = nx.to_scipy_sparse_array(G, nodelist=nodes, format='coo')
+        once = S.row < S.col
+        src, dst, w = S.row[once], S.col[once], S.data[once]
+        iu = np.triu_indices(n, 1)
+        
+        # Pull each connected component's centroid towards the origin so
+        # disconnected pieces are not pushed apart without bound
+        index = {node: i for i, node in enumerate(nodes)}
+        labels = np.empty(n, dtype=np.intp)
+        for c, comp in enumerate(nx.connected_components(G)):
+            labels[[index[node] for node in comp]] = c
+        sizes = np.bincount(labels)
+
+        def energy(x):
+            pos = x.reshape(n, 2)
+            # Repulsive -k^2 log d between all pairs, gradient the k^2/d FR force
+            delta = pos[:, None, :] - pos[None, :, :]
+            d2 = np.maximum(np.einsum('ijk,ijk->ij', delta, delta), 1e-10)
+            e = -0.5 * k * k * np.sum(np.log(d2[iu]))
+            grad = np.einsum('ij,ijk->ik', -k * k / d2, delta)
             
-            packet = Circle((px, py), 0.025, color='#00FF00', 
-                          ec='#006600', linewidth=2, zorder=8)
-            self.ax.add_patch(packet)
+            # Attractive d^3/(3k) along edges, gradient the d^2/k FR force
+            ed = pos[src] - pos[dst]
+            d2e = np.einsum('ij,ij->i', ed, ed)
+            de = np.sqrt(d2e)
+            e += np.sum(w * d2e * de) / (3 * k)
+            fe = (w * de / k)[:, None] * ed
+            for axis in range(2):
+                grad[:, axis] += (np.bincount(src, fe[:, axis], n)
+                                  - np.bincount(dst, fe[:, axis], n))
             
-            self.ax.text(px, py - 0.1, '📦', ha='center', va='center',
-                        fontsize=16, zorder=9)
+            centers = np.zeros((len(sizes), 2))
+            np.add.at(centers, labels, pos)
+            centers /= sizes[:, None]
+            e += 0.5 * gravity * np.sum(sizes * np.einsum('ij,ij->i', centers, centers))
+            grad += gravity * centers[labels]
+            return e, grad.ravel()
 
-        self.ax.set_aspect('equal')
-        self.ax.set_title('Network Topology Visualization', 
-                         fontsize=16, fontweight='bold', pad=20)
-        self.canvas.draw_idle()
+        x0 = np.random.rand(2 * n) - 0.5
+        res = minimize(energy, x0, jac=True, method='L-BFGS-B',
+                       options={'maxiter': 200})
+        return res.x.reshape(n, 2)
+
+    def _on_draw(self, event):
+        # A full draw just finished: cache the static layer and put the
+        # animated artists back on top of it
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        # The whole canvas is on screen now, nothing stale to erase
+        self._overlay_bbox = None
+        if (self._frame_packet_pos is not None or self._drag_active
+                or self._hover_node is not None):
+            self._blit_frame()
+
+    def _on_resize(self, event):
+        # Scatter marker sizes are fixed in points, rescale them with the
+        # window; the draw that follows the resize recaches the background
+        if len(self.G) > SCATTER_NODE_THRESHOLD:
+            self._scale_node_scatter()
+
+    def _draw_dynamic(self, packet_pos=None, pulse_nodes=None):
+        """Update only the packet, trail and pulse artists for one frame"""
+        self._frame_packet_pos = packet_pos
+        self._frame_pulse_nodes = pulse_nodes
+        # Until the pending full draw lands there is no valid background;
+        # _on_draw() blits this frame as soon as it does
+        if self.background is not None:
+            self._blit_frame()
+
+    def _blit_frame(self):
+        self.canvas.restore_region(self.background)
+        artists = self._overlay_artists()
+        for artist in artists:
+            self.ax.draw_artist(artist)
+        
+        # Only push the pixels the overlay covers now or covered on the
+        # previous frame, padded for antialiasing
+        renderer = self.canvas.get_renderer()
+        boxes = [self._overlay_extent(artist, renderer) for artist in artists]
+        bbox = Bbox.union(boxes).padded(8) if boxes else None
+        dirty = [b for b in (bbox, self._overlay_bbox) if b is not None]
+        self._overlay_bbox = bbox
+        if dirty:
+            dirty = Bbox.intersection(Bbox.union(dirty), self.ax.bbox)
+            if dirty is not None:
+                self.canvas.blit(dirty)
+
+    def _overlay_extent(self, artist, renderer):
+        # Collections report no usable window extent for line segments or
+        # screen-sized markers, so bound their data points instead
+        if isinstance(artist, LineCollection):
+            segs = artist.get_segments()
+            if not segs:
+                return Bbox.null()
+            pts = np.concatenate(segs)
+        elif artist is self.packet_scatter:
+            # The glow marker is the largest of the three
+            r = np.sqrt(self.PACKET_SIZES.max()) / 2 * self.fig.dpi / 72
+            x, y = self.ax.transData.transform(artist.get_offsets()[0])
+            return Bbox([[x - r, y - r], [x + r, y + r]])
+        elif isinstance(artist, Text) and artist.get_bbox_patch() is not None:
+            # A label's box sits outside the text by its pad, which grows
+            # with the dpi, so it has to be bounded as well
+            return Bbox.union([artist.get_window_extent(renderer),
+                               artist.get_bbox_patch().get_window_extent(renderer)])
+        else:
+            return artist.get_window_extent(renderer)
+        return Bbox(self.ax.transData.transform([pts.min(axis=0), pts.max(axis=0)]))
+
+    def _overlay_artists(self):
+        """Update the animated artists for the current state and return them"""
+        artists = []
+        if self._drag_active:
+            artists += self._update_drag_layer()
+        if self._frame_packet_pos is not None:
+            artists += self._update_packet_layer()
+        if self._hover_node is not None:
+            self.hover_label.xy = self.pos_xy[self.node_index[self._hover_node]]
+            self.hover_label.set_text(self._label_text(self._hover_node))
+            artists.append(self.hover_label)
+        return artists
+
+    def _update_drag_layer(self):
+        x, y = self.pos_xy[self.node_index[self.drag_node]]
+        artists = []
+        if self._drag_neighbors:
+            self._drag_segs[np.arange(len(self._drag_ends)), self._drag_ends] = (x, y)
+            self.drag_lc.set_segments(self._drag_segs)
+            # Neighbours are animated too, so they stay above the moving edges
+            artists.append(self.drag_lc)
+            artists += [self.node_circles[node] for node in self._drag_neighbors]
+
+        patch = self.node_circles[self.drag_node]
+        if isinstance(patch, Circle):
+            patch.set_center((x, y))
+        else:
+            patch.set_xy((x - patch.get_width() / 2, y - patch.get_height() / 2))
+        label = self._label_artists[self.drag_node]
+        label.set_position((x, y + 0.12))
+        return artists + [patch, label]
+
+    def _update_packet_layer(self):
+        artists = []
+        pulse_nodes = [n for n in (self._frame_pulse_nodes or []) if n in self.node_index]
+        pulse_factor = self.PULSE_LUT[self.animation_frame & 255]
+        for glow, node in zip(self.pulse_glows, pulse_nodes):
+            base_size = 0.06 if node == self.selected_node else 0.05
+            radius = base_size * 1.5 * pulse_factor
+            glow.set_center(self.pos_xy[self.node_index[node]])
+            glow.set_radius(radius)
+            glow.set_width(radius - base_size)
+            patch = self.node_circles.get(node)
+            glow.set_color(patch.get_facecolor() if patch is not None else
+                           DEVICE_RGBA[self.G.nodes[node].get('device', 'Router')])
+            glow.set_alpha(0.3)
+            artists.append(glow)
+
+        if len(self.packet_trail) > 1:
+            trail = np.asarray(self.packet_trail)
+            self.trail_lc.set_segments(np.stack([trail[:-1], trail[1:]], axis=1))
+            self.trail_lc.set_color(self.TRAIL_COLORS[-(len(trail) - 1):])
+            artists.append(self.trail_lc)
+
+        px, py = self._frame_packet_pos
+        self.packet_scatter.set_offsets([(px, py)] * 3)
+        self.packet_label.set_position((px, py - 0.1))
+        artists += [self.packet_scatter, self.packet_label]
+        return artists
+
+    def _refresh_static(self):
+        # Rebuild the static layer, keeping any in-progress animation styling
+        self._static_dirty = True
+        if self.animating:
+            self._draw_static()
+        else:
+            self.redraw()
 
     def on_click(self, event):
         if event.xdata is None or event.ydata is None:
             return
+        # Until the background layout lands the nodes sit at placeholder
+        # positions and have no artists to pick or drag
+        if self._layout_job is not None:
+            return
         
-        nearest = None
-        min_dist = 1e9
-        for n, p in self.pos.items():
-            dx = p[0] - event.xdata
-            dy = p[1] - event.ydata
-            d = dx*dx + dy*dy
-            if d < min_dist:
-                min_dist = d
-                nearest = n
-        
-        if nearest and min_dist < 0.01:
+        nearest = self._node_at(event.xdata, event.ydata)
+        if nearest:
             self.selected_node = nearest
             self.dragging = True
             self.drag_node = nearest
             
             # Update device type selector and IP selector
-            self.device_type.set(self.node_devices.get(nearest, 'Router'))
+            attrs = self.G.nodes[nearest]
+            self.device_type.set(attrs.get('device', 'Router'))
             self.ip_node_var.set(nearest)
-            if nearest in self.node_ips:
+            if 'ip' in attrs:
                 self.ip_entry.delete(0, tk.END)
-                self.ip_entry.insert(0, self.node_ips[nearest])
+                self.ip_entry.insert(0, attrs['ip'])
         else:
             self.selected_node = None
         
         self.update_comboboxes()
-        self.redraw()
+        self._refresh_static()
+
+    def _node_at(self, x, y):
+        """Return the node within 0.1 of (x, y), or None"""
+        if len(self.pos_nodes) > KDTREE_THRESHOLD and cKDTree is not None:
+            if self._kdtree is None:
+                self._kdtree = cKDTree(self.pos_xy)
+            # Misses come back as index len(pos_nodes)
+            _, idx = self._kdtree.query((x, y), distance_upper_bound=0.1)
+            if idx < len(self.pos_nodes):
+                return self.pos_nodes[idx]
+        elif self.pos_nodes:
+            diff = self.pos_xy - np.array([x, y], dtype=np.float32)
+            d2 = np.einsum('ij,ij->i', diff, diff)
+            idx = int(d2.argmin())
+            if d2[idx] < 0.01:
+                return self.pos_nodes[idx]
+        return None
 
     def on_release(self, event):
+        moved = self.dragging and self._drag_moved
+        if moved and event.xdata is not None and event.ydata is not None:
+            self._move_drag_node(event.xdata, event.ydata)
         self.dragging = False
         self.drag_node = None
+        self._drag_moved = False
+        # Fold the dragged node back into the static layer
+        if self._drag_active:
+            self._refresh_static()
 
     def on_motion(self, event):
-        if not self.dragging or event.xdata is None or event.ydata is None:
+        if event.xdata is None or event.ydata is None:
             return
-        if self.drag_node:
-            self.pos[self.drag_node] = (event.xdata, event.ydata)
-            self.redraw()
+        if not self.dragging:
+            self._hover(event.xdata, event.ydata)
+        elif self.drag_node:
+            # Every queued motion event only moves the node; they are
+            # coalesced into a single blit once Tk is idle
+            self._move_drag_node(event.xdata, event.ydata)
+            self._drag_moved = True
+            self._schedule_blit()
+
+    def _hover(self, x, y):
+        # Scatter-drawn nodes have no label of their own; show the label of
+        # the one under the pointer
+        if len(self.G) <= SCATTER_NODE_THRESHOLD and self._hover_node is None:
+            return
+        if self._layout_job is not None:
+            return
+        node = self._node_at(x, y)
+        if node in self._label_artists:
+            node = None
+        if node != self._hover_node:
+            self._hover_node = node
+            self._schedule_blit()
+
+    def _schedule_blit(self):
+        if not self._blit_pending:
+            self._blit_pending = True
+            self.root.after_idle(self._idle_blit)
+
+    def _idle_blit(self):
+        self._blit_pending = False
+        if self.background is not None:
+            self._blit_frame()
+
+    def _move_drag_node(self, x, y):
+        self.pos_xy[self.node_index[self.drag_node]] = (x, y)
+        self._kdtree = None
+        if self._unicast_path is not None and self.drag_node in self._unicast_path:
+            self._retarget_packet(self.drag_node)
+        elif self._broadcast_hop is not None and self.drag_node in self._broadcast_hop:
+            self._retarget_hop()
+
+    def _retarget_packet(self, node):
+        # A node on the packet's path moved: re-ease the hops into and out
+        # of it. The table is updated in place, since the running frame
+        # generator holds on to it.
+        F = self.frames_per_edge
+        te = self._ease_in_out(np.linspace(0, 1, F, endpoint=False))
+        path = self._unicast_path
+        k = path.index(node)
+        ni = self.node_index
+        for hop in range(max(k - 1, 0), min(k + 1, len(path) - 1)):
+            # Path nodes may have been removed since the unicast started
+            if path[hop] not in ni or path[hop + 1] not in ni:
+                continue
+            p0, p1 = self.pos_xy[[ni[path[hop]], ni[path[hop + 1]]]]
+            self._packet_xy[hop * F:(hop + 1) * F] = p0 + (p1 - p0) * te[:, None]
+
+    def _retarget_hop(self):
+        # Ease the running broadcast hop between the current positions of
+        # its endpoints, so a dragged endpoint is followed like in unicast
+        t = np.linspace(0, 1, self.frames_per_edge, endpoint=False)
+        start_node, end_node = self._broadcast_hop
+        if start_node not in self.node_index or end_node not in self.node_index:
+            # An endpoint was removed; the next tick skips this hop
+            return
+        p0, p1 = self.pos_xy[[self.node_index[start_node], self.node_index[end_node]]]
+        self._hop_xy = p0 + (p1 - p0) * self._ease_in_out(t)[:, None]
 
     # ---------- Animation with packet loss ----------
     def start_animation(self):
@@ -688,6 +1436,10 @@ class NetworkVisualizerApp:
             messagebox.showwarning('Animate', 'Source/Destination not in graph.')
             return
         
+        if self._layout_job is not None:
+            messagebox.showinfo('Animation', 'The layout is still being computed.')
+            return
+        
         # Set packet loss rate
         self.packet_loss_rate = self.loss_var.get() / 100.0
         
@@ -701,18 +1453,28 @@ class NetworkVisualizerApp:
 
     def start_unicast_animation(self, src, dst):
         try:
-            path = nx.shortest_path(self.G, source=src, target=dst)
+            path = self._shortest_path(src, dst)
         except nx.NetworkXNoPath:
             messagebox.showerror('Path Error', 'No path between selected nodes.')
             return
         
         self.animating = True
         self.animation_frame = 0
-        self.packet_trail = []
+        self.packet_trail = deque(maxlen=15)
         self.current_path = path
         
-        src_ip = self.node_ips.get(src, 'N/A')
-        dst_ip = self.node_ips.get(dst, 'N/A')
+        # Eased packet positions for every frame of every hop, computed once;
+        # row hop * F + frame is the packet position for that frame
+        F = self.frames_per_edge
+        te = self._ease_in_out(np.linspace(0, 1, F, endpoint=False))
+        pts = self.pos_xy[[self.node_index[n] for n in path]]
+        p0 = pts[:-1, None, :]
+        p1 = pts[1:, None, :]
+        xy = p0 + (p1 - p0) * te[None, :, None]
+        self._packet_xy = xy.reshape(-1, 2).astype(np.float32)
+        
+        src_ip = self.G.nodes[src].get('ip', 'N/A')
+        dst_ip = self.G.nodes[dst].get('ip', 'N/A')
         
         self.log(f"\n{'='*50}")
         self.log(f"🚀 UNICAST TRANSMISSION STARTED")
@@ -722,7 +1484,13 @@ class NetworkVisualizerApp:
         self.log(f"Packet Loss Rate: {self.packet_loss_rate*100:.1f}%")
         self.log(f"{'='*50}\n")
         
-        self._animate_smooth(path, 0, 0)
+        # The highlighted path is static for the whole transmission
+        self.redraw(highlight_path=path)
+        # Frames are driven by one persistent tick
+        self._frame_interval = self.animation_speed
+        self._unicast_iter = self._unicast_frames(self._packet_xy)
+        self._unicast_path = path
+        self._unicast_tick()
 
     def start_broadcast_animation(self, src, dst):
         # Get all nodes except source
@@ -734,13 +1502,13 @@ class NetworkVisualizerApp:
         
         self.animating = True
         self.animation_frame = 0
-        self.packet_trail = []
+        self.packet_trail = deque(maxlen=10)
         self.broadcast_visited = set()
         self.broadcast_rejected = set()
         self.broadcast_accepted = None
         
-        src_ip = self.node_ips.get(src, 'N/A')
-        dst_ip = self.node_ips.get(dst, 'N/A')
+        src_ip = self.G.nodes[src].get('ip', 'N/A')
+        dst_ip = self.G.nodes[dst].get('ip', 'N/A')
         
         self.log(f"\n{'='*50}")
         self.log(f"📡 BROADCAST TRANSMISSION STARTED")
@@ -750,120 +1518,99 @@ class NetworkVisualizerApp:
         self.log(f"Packet Loss Rate: {self.packet_loss_rate*100:.1f}%")
         self.log(f"{'='*50}\n")
         
-        # Start BFS broadcast
-        self._animate_broadcast(src, dst, visited=set([src]))
+        # Start BFS broadcast; the whole traversal is planned up front as
+        # (parent, child) hops and each node is reached exactly once
+        self.bfs_plan = list(nx.bfs_edges(self.G, src))
+        self.bfs_idx = 0
+        self._hop_frame = 0
+        self._broadcast_target = dst
+        self._broadcast_tick()
 
-    def _animate_broadcast(self, current, target, visited):
+    def _broadcast_tick(self):
+        """Advance the broadcast by one frame and schedule the next tick"""
+        # One persistent callback reads the hop and frame from the instance,
+        # rather than a chain of per-frame lambdas
+        self._tick_id = None
         if not self.animating:
             return
         
-        # Get neighbors not yet visited
-        neighbors = [n for n in self.G.neighbors(current) if n not in visited]
+        # Hops to or from nodes removed since the plan was made are skipped
+        while (self.bfs_idx < len(self.bfs_plan)
+               and not all(n in self.G for n in self.bfs_plan[self.bfs_idx])):
+            self.bfs_idx += 1
+            self._hop_frame = 0
         
-        if not neighbors:
-            # No more neighbors, end broadcast
-            self._end_broadcast(target)
+        if self.bfs_idx >= len(self.bfs_plan):
+            # Every reachable node has been visited, end broadcast
+            self._end_broadcast(self._broadcast_target)
             return
         
-        # Animate to first neighbor
-        neighbor = neighbors[0]
-        visited.add(neighbor)
-        
-        try:
-            path = [current, neighbor]
-            self._animate_broadcast_segment(path, 0, 0, neighbor, target, visited, neighbors[1:])
-        except:
-            self._end_broadcast(target)
+        parent, child = self.bfs_plan[self.bfs_idx]
+        if self._hop_frame < self.frames_per_edge:
+            self._broadcast_frame([parent, child], self._hop_frame)
+            self._hop_frame += 1
+            delay = self.animation_speed
+        else:
+            self._broadcast_arrive(child, self._broadcast_target)
+            # Continue with the next hop of the plan
+            self.bfs_idx += 1
+            self._hop_frame = 0
+            delay = 300
+        self._tick_id = self.root.after(delay, self._broadcast_tick)
 
-    def _animate_broadcast_segment(self, path, edge_idx, frame, current_node, 
-                                   target, visited, remaining_neighbors):
-        if not self.animating:
-            return
-        
-        if edge_idx >= len(path) - 1:
-            # Check for packet loss
-            if random.random() < self.packet_loss_rate:
-                self.log(f"❌ Packet LOST at {current_node}")
-                self.broadcast_rejected.add(current_node)
-                
-                # Continue to remaining neighbors from previous node
-                if remaining_neighbors:
-                    prev_node = path[0]
-                    next_neighbor = remaining_neighbors[0]
-                    visited.add(next_neighbor)
-                    new_path = [prev_node, next_neighbor]
-                    self.root.after(300, lambda: self._animate_broadcast_segment(
-                        new_path, 0, 0, next_neighbor, target, visited, remaining_neighbors[1:]))
-                else:
-                    # Continue broadcast from current node
-                    self.root.after(300, lambda: self._animate_broadcast(current_node, target, visited))
-                return
-            
-            # Packet arrived at node
-            self.broadcast_visited.add(current_node)
-            
-            # Check if this node accepts the packet
-            current_ip = self.node_ips.get(current_node, '')
-            target_ip = self.node_ips.get(target, '')
-            
-            if current_ip and target_ip and current_ip == target_ip:
-                self.log(f"✅ {current_node} ACCEPTED packet (IP match: {current_ip})")
-                self.broadcast_accepted = current_node
-            else:
-                self.log(f"🔄 {current_node} rejected packet (IP: {current_ip} ≠ {target_ip})")
-                self.broadcast_rejected.add(current_node)
-            
-            # Continue to remaining neighbors from previous node
-            if remaining_neighbors:
-                prev_node = path[0]
-                next_neighbor = remaining_neighbors[0]
-                visited.add(next_neighbor)
-                new_path = [prev_node, next_neighbor]
-                self.root.after(300, lambda: self._animate_broadcast_segment(
-                    new_path, 0, 0, next_neighbor, target, visited, remaining_neighbors[1:]))
-            else:
-                # Continue broadcast from current node
-                self.root.after(300, lambda: self._animate_broadcast(current_node, target, visited))
-            return
-        
-        # Animate packet movement
-        start_node = path[edge_idx]
-        end_node = path[edge_idx + 1]
+    def _broadcast_frame(self, path, frame):
+        start_node, end_node = path
         
-        t = frame / self.frames_per_edge
-        x1, y1 = self.pos[start_node]
-        x2, y2 = self.pos[end_node]
-        
-        t_eased = self._ease_in_out(t)
-        px = x1 + (x2 - x1) * t_eased
-        py = y1 + (y2 - y1) * t_eased
+        # Eased packet positions for every frame of the hop, computed when
+        # it starts; the static layer also only changes once per segment
+        if frame == 0:
+            self._broadcast_hop = path
+            self._retarget_hop()
+            self.redraw(highlight_path=path,
+                       rejected_nodes=self.broadcast_rejected,
+                       broadcast_nodes=[self.broadcast_accepted] if self.broadcast_accepted else None)
         
+        px, py = self._hop_xy[frame]
         self.packet_trail.append((px, py))
-        if len(self.packet_trail) > 10:
-            self.packet_trail.pop(0)
-        
-        pulse_nodes = [start_node, end_node]
         
         self.animation_frame += 1
-        self.redraw(highlight_path=path, packet_pos=(px, py), 
-                   pulse_nodes=pulse_nodes,
-                   rejected_nodes=self.broadcast_rejected,
-                   broadcast_nodes=[self.broadcast_accepted] if self.broadcast_accepted else None)
+        self._draw_dynamic(packet_pos=(px, py), pulse_nodes=path)
+
+    def _broadcast_arrive(self, current_node, target):
+        # Check for packet loss
+        if random.random() < self.packet_loss_rate:
+            self.log(f"❌ Packet LOST at {current_node}")
+            self.broadcast_rejected.add(current_node)
+            return
+        
+        # Packet arrived at node
+        self.broadcast_visited.add(current_node)
+        
+        # Check if this node accepts the packet
+        # Either node may have been removed while the broadcast ran
+        current = self.G.nodes.get(current_node, {})
+        current_ip = current.get('ip', '')
+        target_ip = self.G.nodes.get(target, {}).get('ip', '')
+        target_int = self.G.nodes.get(target, {}).get('ip_int')
+        current_int = current.get('ip_int')
+        if target_int is not None and current_int is not None:
+            accepted = current_int == target_int
+        else:
+            # Addresses that do not parse, like the 192.168.1.256 and up
+            # that auto-assign hands out, are matched as strings
+            accepted = bool(current_ip) and current_ip == target_ip
         
-        if frame < self.frames_per_edge - 1:
-            self.root.after(self.animation_speed, 
-                          lambda: self._animate_broadcast_segment(
-                              path, edge_idx, frame + 1, current_node, 
-                              target, visited, remaining_neighbors))
+        if accepted:
+            self.log(f"✅ {current_node} ACCEPTED packet (IP match: {current_ip})")
+            self.broadcast_accepted = current_node
         else:
-            self.root.after(self.animation_speed, 
-                          lambda: self._animate_broadcast_segment(
-                              path, edge_idx + 1, 0, current_node, 
-                              target, visited, remaining_neighbors))
+            self.log(f"🔄 {current_node} rejected packet (IP: {current_ip} ≠ {target_ip})")
+            self.broadcast_rejected.add(current_node)
 
     def _end_broadcast(self, target):
         self.animating = False
-        self.packet_trail = []
+        self._broadcast_hop = None
+        self.packet_trail.clear()
         
         self.log(f"\n{'='*50}")
         if self.broadcast_accepted:
@@ -879,113 +1626,161 @@ class NetworkVisualizerApp:
         
         # Show summary
         if self.broadcast_accepted:
-            messagebox.showinfo('Broadcast Complete', 
+            self._show_status('Broadcast Complete', 
                               f'✅ Packet delivered to {self.broadcast_accepted}!\n\n'
                               f'Nodes visited: {len(self.broadcast_visited)}\n'
                               f'Packets lost: {len(self.broadcast_rejected)}')
         else:
-            messagebox.showwarning('Broadcast Complete', 
-                                  f'⚠️ No node accepted the packet.\n\n'
-                                  f'Nodes visited: {len(self.broadcast_visited)}\n'
-                                  f'Packets lost: {len(self.broadcast_rejected)}')
+            self._show_status('Broadcast Complete', 
+                              f'⚠️ No node accepted the packet.\n\n'
+                              f'Nodes visited: {len(self.broadcast_visited)}\n'
+                              f'Packets lost: {len(self.broadcast_rejected)}')
+
+    def _show_status(self, title, message):
+        # Animation results go to a non-modal popup rather than a messagebox,
+        # so the event loop never waits on the user. The popup is created
+        # once, reused for every result and hides itself after 3 s.
+        popup = self._status_popup
+        if popup is None:
+            popup = self._status_popup = tk.Toplevel(self.root)
+            popup.withdraw()
+            popup.transient(self.root)
+            popup.resizable(False, False)
+            popup.protocol('WM_DELETE_WINDOW', popup.withdraw)
+            self._status_label = ttk.Label(popup, padding=15, justify=tk.LEFT)
+            self._status_label.pack()
+        popup.title(title)
+        self._status_label.configure(text=message)
+        popup.deiconify()
+        popup.lift()
+        if self._status_hide_id is not None:
+            self.root.after_cancel(self._status_hide_id)
+        self._status_hide_id = self.root.after(3000, popup.withdraw)
 
     def stop_animation(self):
         self.animating = False
-        self.packet_trail = []
+        self._unicast_path = None
+        self._broadcast_hop = None
+        if self._tick_id is not None:
+            self.root.after_cancel(self._tick_id)
+            self._tick_id = None
+        self.packet_trail.clear()
         self.redraw()
         self.log("⏹️ Animation stopped by user\n")
 
-    def _animate_smooth(self, path, edge_idx, frame):
-        if not self.animating:
+    def _unicast_frames(self, xy):
+        # Frames follow the monotonic clock through a fixed-timestep
+        # accumulator, so late timer ticks skip frames rather than slow the
+        # packet down. A skip never passes the first frame of a hop, where
+        # the loss check runs. Ends as soon as this transmission stops.
+        F = self.frames_per_edge
+        i = 0
+        accum = 0.0
+        t_prev = time.monotonic()
+        while True:
+            yield i
+            if not self.animating or self._packet_xy is not xy:
+                return
+            now = time.monotonic()
+            accum += now - t_prev
+            t_prev = now
+            period = self._frame_interval / 1000
+            steps = max(1, int(accum / period))
+            accum = max(0.0, accum - steps * period)
+            hop_end = (i // F + 1) * F
+            if i + steps >= hop_end:
+                steps = hop_end - i
+                accum = 0.0
+            i += steps
+
+    def _unicast_tick(self):
+        self._tick_id = None
+        i = next(self._unicast_iter, None)
+        if i is None:
             return
-        
-        if edge_idx >= len(path) - 1:
+        self._unicast_frame(i, self._unicast_path)
+        if self.animating:
+            self._tick_id = self.root.after(self._frame_interval, self._unicast_tick)
+
+    def _unicast_frame(self, i, path):
+        if i == len(self._packet_xy):
             # Animation complete - check final delivery
-            self.animating = False
-            self.packet_trail = []
-            
-            # Check for packet loss at destination
-            if random.random() < self.packet_loss_rate:
-                self.log(f"❌ PACKET LOST at destination {path[-1]}")
-                self.log(f"{'='*50}\n")
-                self.redraw(highlight_path=path)
-                messagebox.showerror('Packet Lost!', 
-                                   f'❌ Packet was lost at destination!\n\n'
-                                   f'Loss occurred at: {path[-1]}\n'
-                                   f'Packet loss rate: {self.packet_loss_rate*100:.1f}%')
-            else:
-                self.log(f"✅ PACKET DELIVERED successfully to {path[-1]}")
-                self.log(f"{'='*50}\n")
-                self.redraw(highlight_path=path)
-                messagebox.showinfo('Success', 
-                                  f'✅ Packet delivered successfully to {path[-1]}!')
+            self._end_unicast(path)
             return
         
-        # Check for packet loss at this hop
-        if frame == 0 and edge_idx > 0:
-            if random.random() < self.packet_loss_rate:
-                current_node = path[edge_idx]
-                self.animating = False
-                self.packet_trail = []
-                
-                self.log(f"❌ PACKET LOST at hop {edge_idx}: {current_node}")
-                self.log(f"{'='*50}\n")
-                
-                self.redraw(highlight_path=path[:edge_idx+1])
-                messagebox.showerror('Packet Lost!', 
-                                   f'❌ Packet was lost during transmission!\n\n'
-                                   f'Loss occurred at: {current_node}\n'
-                                   f'Hop number: {edge_idx} of {len(path)-1}\n'
-                                   f'Packet loss rate: {self.packet_loss_rate*100:.1f}%')
-                return
-        
-        # Current edge
+        edge_idx, frame = divmod(i, self.frames_per_edge)
         start_node = path[edge_idx]
         end_node = path[edge_idx + 1]
         
-        # Get cable speed multiplier
-        cable_type = self.edge_cables.get((start_node, end_node), 'Ethernet')
-        speed_mult = CABLE_TYPES[cable_type]['speed']
-        adjusted_speed = int(self.animation_speed / speed_mult)
-        
-        # Interpolate position
-        t = frame / self.frames_per_edge
-        x1, y1 = self.pos[start_node]
-        x2, y2 = self.pos[end_node]
+        if frame == 0:
+            # Check for packet loss at this hop
+            if edge_idx > 0 and random.random() < self.packet_loss_rate:
+                self._end_unicast(path, lost_hop=edge_idx)
+                return
+            
+            # Cable speed applies to the whole hop
+            # The edge may have been removed mid-flight
+            cable_type = self.G.get_edge_data(start_node, end_node, default={}).get('cable', 'Ethernet')
+            speed_mult = CABLE_TYPES[cable_type]['speed']
+            self._frame_interval = int(self.animation_speed / speed_mult)
+            
+            self.log(f"📍 Hop {edge_idx + 1}/{len(path)-1}: {start_node} → {end_node} "
+                    f"(via {cable_type})")
         
-        t_eased = self._ease_in_out(t)
-        px = x1 + (x2 - x1) * t_eased
-        py = y1 + (y2 - y1) * t_eased
+        # Precomputed interpolated position
+        px, py = self._packet_xy[i]
         
         # Update trail
         self.packet_trail.append((px, py))
-        if len(self.packet_trail) > 15:
-            self.packet_trail.pop(0)
-        
-        pulse_nodes = [start_node, end_node]
         
-        # Log progress
-        if frame == 0:
-            self.log(f"📍 Hop {edge_idx + 1}/{len(path)-1}: {start_node} → {end_node} "
-                    f"(via {cable_type})")
-        
-        self.animation_frame += 1
-        self.redraw(highlight_path=path, packet_pos=(px, py), 
-                   pulse_nodes=pulse_nodes)
+        self.animation_frame = i + 1
+        self._draw_dynamic(packet_pos=(px, py), pulse_nodes=[start_node, end_node])
+
+    def _end_unicast(self, path, lost_hop=None):
+        self.animating = False
+        self._unicast_path = None
+        self.packet_trail.clear()
         
-        # Next frame
-        if frame < self.frames_per_edge - 1:
-            self.root.after(adjusted_speed, 
-                          lambda: self._animate_smooth(path, edge_idx, frame + 1))
+        if lost_hop is not None:
+            current_node = path[lost_hop]
+            self.log(f"❌ PACKET LOST at hop {lost_hop}: {current_node}")
+            self.log(f"{'='*50}\n")
+            
+            self.redraw(highlight_path=path[:lost_hop+1])
+            self._show_status('Packet Lost!', 
+                              f'❌ Packet was lost during transmission!\n\n'
+                              f'Loss occurred at: {current_node}\n'
+                              f'Hop number: {lost_hop} of {len(path)-1}\n'
+                              f'Packet loss rate: {self.packet_loss_rate*100:.1f}%')
+        # Check for packet loss at destination
+        elif random.random() < self.packet_loss_rate:
+            self.log(f"❌ PACKET LOST at destination {path[-1]}")
+            self.log(f"{'='*50}\n")
+            self.redraw(highlight_path=path)
+            self._show_status('Packet Lost!', 
+                              f'❌ Packet was lost at destination!\n\n'
+                              f'Loss occurred at: {path[-1]}\n'
+                              f'Packet loss rate: {self.packet_loss_rate*100:.1f}%')
         else:
-            self.root.after(adjusted_speed, 
-                          lambda: self._animate_smooth(path, edge_idx + 1, 0))
+            self.log(f"✅ PACKET DELIVERED successfully to {path[-1]}")
+            self.log(f"{'='*50}\n")
+            self.redraw(highlight_path=path)
+            self._show_status('Success', 
+                              f'✅ Packet delivered successfully to {path[-1]}!')
 
     def _ease_in_out(self, t):
-        """Smooth easing function"""
+        """Smooth easing function, elementwise for arrays of t"""
         return t * t * (3.0 - 2.0 * t)
 
     # ---------- Statistics ----------
+    def _stats_visible(self):
+        return self.notebook.select() == str(self._stats_tab)
+
+    def _on_tab_changed(self, event):
+        # Statistics are only computed while their tab is showing
+        if self._stats_visible():
+            self.update_statistics()
+
     def update_statistics(self):
         self.stats_text.delete(1.0, tk.END)
         
@@ -997,55 +1792,146 @@ class NetworkVisualizerApp:
         
         # Device breakdown
         stats.append("\nDevice Types:")
-        device_counts = {}
-        for device in self.node_devices.values():
-            device_counts[device] = device_counts.get(device, 0) + 1
+        # Unary + drops the types whose count fell back to zero
+        device_counts = +self._device_counts
         for device, count in sorted(device_counts.items()):
             icon = DEVICE_TYPES[device]['icon']
             stats.append(f"  {icon} {device}: {count}")
         
         # Cable breakdown
         stats.append("\nCable Types:")
-        cable_counts = {}
-        for cable in self.edge_cables.values():
-            cable_counts[cable] = cable_counts.get(cable, 0) + 1
+        cable_counts = +self._cable_counts
         for cable, count in sorted(cable_counts.items()):
             stats.append(f"  {cable}: {count}")
         
         # IP assignments
-        stats.append(f"\nIP Addresses Assigned: {len(self.node_ips)}")
-        stats.append(f"Unassigned Nodes: {len(self.G.nodes) - len(self.node_ips)}")
-        
-        # Network metrics
-        if len(self.G) > 0:
-            stats.append("\nNetwork Metrics:")
-            stats.append(f"  Connected: {'Yes' if nx.is_connected(self.G) else 'No'}")
-            if nx.is_connected(self.G):
-                stats.append(f"  Diameter: {nx.diameter(self.G)}")
-                stats.append(f"  Avg Path Length: {nx.average_shortest_path_length(self.G):.2f}")
-            stats.append(f"  Density: {nx.density(self.G):.3f}")
+        ips = nx.get_node_attributes(self.G, 'ip')
+        stats.append(f"\nIP Addresses Assigned: {len(ips)}")
+        stats.append(f"Unassigned Nodes: {len(self.G.nodes) - len(ips)}")
+        
+        stats += self._network_metrics()
         
         self.stats_text.insert(1.0, '\n'.join(stats))
 
+    def _network_metrics(self):
+        # Path metrics are all-pairs BFS, so they are only recomputed when
+        # the topology changes; device and IP counts above are cheap
+        version, lines = self._metrics_cache
+        if version == self._topology_version:
+            return lines
+        if len(self.G) <= BACKGROUND_METRICS_THRESHOLD:
+            lines = self._compute_metrics(self.G)
+            self._metrics_cache = (self._topology_version, lines)
+            return lines
+        if self._metrics_job is None:
+            self._start_metrics_job()
+        return ["\nNetwork Metrics:", "  Computing..."]
+
+    def _start_metrics_job(self):
+        # Like the layout, large graphs are measured from a snapshot on a
+        # worker thread; _pump_metrics() posts the result on the Tk thread
+        G = self.G.copy()
+        version = self._topology_version
+        
+        def work():
+            # As for layouts, a failure is queued instead of a result
+            try:
+                result = self._compute_metrics(G)
+            except Exception as e:
+                result = e
+            self._metrics_queue.put((version, result))
+        
+        self._metrics_job = threading.Thread(target=work, daemon=True)
+        self._metrics_job.start()
+        self.root.after(50, self._pump_metrics)
+
+    def _pump_metrics(self):
+        try:
+            version, lines = self._metrics_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._pump_metrics)
+            return
+        self._metrics_job = None
+        if isinstance(lines, Exception):
+            self.log(f"❌ Network metrics failed: {lines}")
+            lines = ["\nNetwork Metrics:", "  Unavailable"]
+        # Cached under the version they were computed for, so if the graph
+        # changed meanwhile the refresh below just starts another job
+        self._metrics_cache = (version, lines)
+        if self._stats_visible():
+            self.update_statistics()
+
+    def _compute_metrics(self, G):
+        lines = []
+        if len(G) > 0:
+            lines.append("\nNetwork Metrics:")
+            connected = nx.is_connected(G)
+            lines.append(f"  Connected: {'Yes' if connected else 'No'}")
+            if connected:
+                diameter, avg_length = self._path_metrics(G)
+                lines.append(f"  Diameter: {diameter}")
+                lines.append(f"  Avg Path Length: {avg_length:.2f}")
+            lines.append(f"  Density: {nx.density(G):.3f}")
+        return lines
+
+    def _path_metrics(self, G):
+        """Diameter and average shortest path length of the connected graph"""
+        # Both come from a single all-pairs BFS rather than one pass each
+        n = len(G)
+        if n < 2:
+            return 0, 0.0
+        if csgraph is not None:
+            # BFS from a block of sources at a time, so the distance matrix
+            # held at once stays around 64 MB instead of N^2 floats
+            csr = nx.to_scipy_sparse_array(G, format='csr')
+            rows = max(1, 8_000_000 // n)
+            diameter = total = 0
+            for start in range(0, n, rows):
+                dist = csgraph.shortest_path(csr, directed=False, unweighted=True,
+                                             indices=np.arange(start, min(start + rows, n)))
+                diameter = max(diameter, int(dist.max()))
+                total += dist.sum()
+            return diameter, total / (n * (n - 1))
+        diameter = total = 0
+        for _, lengths in nx.all_pairs_shortest_path_length(G):
+            diameter = max(diameter, max(lengths.values()))
+            total += sum(lengths.values())
+        return diameter, total / (n * (n - 1))
+
     # ---------- Save/Load ----------
     def save_topology(self):
+        # Nodes still waiting for the layout only have placeholder positions
+        if self._layout_job is not None:
+            messagebox.showinfo('Save Topology', 'The layout is still being computed.')
+            return
         fname = filedialog.asksaveasfilename(
             defaultextension='.json',
             filetypes=[('JSON files', '*.json'), ('All files', '*.*')])
         if not fname:
             return
         
+        # Positions are stored as one (N,2) array aligned with 'pos_nodes'
+        pos_xy = self.pos_xy
         data = {
             'nodes': list(self.G.nodes),
             'edges': list(self.G.edges),
-            'pos': {n: list(self.pos[n]) for n in self.pos},
-            'devices': self.node_devices,
-            'ips': self.node_ips,
-            'cables': {f"{a},{b}": cable for (a,b), cable in self.edge_cables.items()}
+            'pos_nodes': self.pos_nodes,
+            'pos_xy': pos_xy,
+            'devices': nx.get_node_attributes(self.G, 'device'),
+            'ips': nx.get_node_attributes(self.G, 'ip'),
+            'cables': {f"{a},{b}": cable
+                       for a, b, cable in self.G.edges(data='cable') if cable is not None}
         }
         
-        with open(fname, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Files stay indented for readability; orjson does that natively
+        if orjson is not None:
+            with open(fname, 'wb') as f:
+                f.write(orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            data['pos_xy'] = pos_xy.tolist()
+            with open(fname, 'w') as f:
+                json.dump(data, f, indent=2)
         
         self.log(f"💾 Topology saved to: {fname}")
         messagebox.showinfo('Success', f'✅ Topology saved to:\n{fname}')
@@ -1057,39 +1943,49 @@ class NetworkVisualizerApp:
             return
         
         try:
-            with open(fname, 'r') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(fname, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(fname, 'r') as f:
+                    data = json.load(f)
             
+            for n in list(self.G.nodes):
+                self._remove_node_artists(n)
             self.G.clear()
-            for n in data.get('nodes', []):
-                self.G.add_node(n)
-            for a, b in data.get('edges', []):
-                self.G.add_edge(a, b)
+            self.G.add_nodes_from(data.get('nodes', []))
+            self.G.add_edges_from(data.get('edges', []))
+            self._topology_changed()
+            self._sorted_nodes = sorted(self.G.nodes)
             
-            pos_data = data.get('pos', {})
-            self.pos = {n: tuple(pos_data.get(n, (0.0, 0.0))) 
-                       for n in self.G.nodes}
+            # Older files store positions as a {node: [x, y]} mapping
+            if 'pos_xy' in data:
+                self._set_positions(data['pos_nodes'], data['pos_xy'])
+            else:
+                pos_data = {n: xy for n, xy in data.get('pos', {}).items() if n in self.G}
+                self._set_positions(list(pos_data), list(pos_data.values()))
+            self._layout_dirty = set()
+            if len(self.pos_nodes) != len(self.G) or self.G.nodes - self.node_index.keys():
+                pos = self.pos
+                # Nodes the file has no position for are laid out on the next
+                # redraw, around the ones it does
+                self._layout_dirty = self.G.nodes - pos.keys()
+                self.pos = {n: pos.get(n, (0.0, 0.0)) for n in self.G.nodes}
             
-            self.node_devices = data.get('devices', {})
-            self.node_ips = data.get('ips', {})
+            nx.set_node_attributes(self.G, data.get('devices', {}), 'device')
+            for n, ip in data.get('ips', {}).items():
+                if n in self.G:
+                    self._set_ip(n, ip)
             
-            # Load cable types
-            self.edge_cables = {}
-            cables_data = data.get('cables', {})
-            for edge_str, cable in cables_data.items():
-                a, b = edge_str.split(',')
-                self.edge_cables[(a, b)] = cable
+            # Load cable types; older files list each edge in both directions
+            cables = {tuple(edge_str.split(',')): cable
+                      for edge_str, cable in data.get('cables', {}).items()}
+            nx.set_edge_attributes(self.G, cables, 'cable')
+            self._recount_types()
             
             # Update node count
-            maxk = 0
-            for n in self.G.nodes:
-                if n.startswith('N'):
-                    try:
-                        k = int(n[1:])
-                        if k > maxk:
-                            maxk = k
-                    except:
-                        pass
+            maxk = max((int(m.group(1)) for n in self.G.nodes if (m := _NID.match(n))),
+                       default=0)
             self.node_count = max(self.node_count, maxk)
             
             self.update_comboboxes()